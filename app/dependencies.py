@@ -42,9 +42,7 @@ def get_db_manager():
             logger.info("✅ Using Supabase PostgreSQL database")
         except Exception as e:
             error_msg = f"Failed to connect to Supabase PostgreSQL: {e}. Please check your DATABASE_URL environment variable."
-            logger.error(f"❌ {error_msg}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"❌ {error_msg}", exc_info=True)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=error_msg
@@ -11,6 +11,10 @@ import glob
 
 logger = logging.getLogger(__name__)
 
+# Repeated dashboard loads within this window reuse the same query results
+# (the cache is also cleared whenever a refresh writes through the db manager)
+DASHBOARD_QUERY_CACHE_TTL_SECONDS = 30
+
 class DashboardService:
     """Service for dashboard data queries"""
     
@@ -38,7 +42,12 @@ class DashboardService:
     def _execute_query(self, query: str, params: tuple = None) -> list:
         """Execute query using PostgreSQL database manager"""
         normalized_query = self._normalize_query(query)
-        return self.db_manager.execute_query(normalized_query, params)
+        return self.db_manager.execute_query(normalized_query, params, cache_ttl=DASHBOARD_QUERY_CACHE_TTL_SECONDS)
+    
+    def _execute_query_df(self, query: str, params: tuple = None) -> pd.DataFrame:
+        """Execute query straight into a DataFrame (no per-row dicts) - for large result sets"""
+        normalized_query = self._normalize_query(query)
+        return self.db_manager.execute_query_df(normalized_query, params)
 
     # Removed _get_database_path - not needed for PostgreSQL
 
@@ -111,10 +120,9 @@ class DashboardService:
                                 FROM "{safe_table_name}"
                                 LIMIT 1000000
                             """
-                            results = self._execute_query(query)
+                            df = self._execute_query_df(query)
                             
-                            if results:
-                                df = pd.DataFrame(results)
+                            if not df.empty:
                                 self._inventory_analysis_cache = df
                                 logger.info(f"✅ Loaded {len(df)} items from Supabase {table_name} table")
                                 return df
@@ -4,11 +4,18 @@ Manages licensed email addresses for access control
 """
 import json
 import os
-from typing import List, Optional, Tuple
+import threading
+from typing import Iterable, List, Optional, Tuple
 from datetime import datetime
 from app.config import settings
 import logging
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup - fall back to stdlib json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 class LicenseService:
@@ -16,6 +23,12 @@ class LicenseService:
     
     def __init__(self):
         self.license_db_path = settings.LICENSE_DB_PATH
+        # In-memory copy of the license file, invalidated when its mtime changes
+        self._cache: Optional[dict] = None
+        self._cache_mtime: int = 0
+        self._licensed_set: frozenset = frozenset()
+        self._admin_set: frozenset = frozenset()
+        self._lock = threading.RLock()
         self._ensure_license_db()
     
     def _ensure_license_db(self):
@@ -28,38 +41,74 @@ class LicenseService:
             })
             logger.info("✅ Created license database")
     
+    def _set_cache(self, data: dict, mtime: int):
+        """Store parsed license data and rebuild the lowercased lookup sets"""
+        self._cache = data
+        self._cache_mtime = mtime
+        self._licensed_set = frozenset(e.lower().strip() for e in data.get('licensed_emails', []))
+        self._admin_set = frozenset(e.lower().strip() for e in data.get('admin_emails', []))
+    
     def _load_licenses(self) -> dict:
-        """Load license database"""
-        try:
-            with open(self.license_db_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading licenses: {e}")
-            return {'licensed_emails': [], 'admin_emails': []}
+        """Load license database (served from memory unless the file changed)"""
+        with self._lock:
+            try:
+                mtime = os.stat(self.license_db_path).st_mtime_ns
+                if self._cache is not None and mtime == self._cache_mtime:
+                    return self._cache
+                if orjson is not None:
+                    with open(self.license_db_path, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(self.license_db_path, 'r') as f:
+                        data = json.load(f)
+                self._set_cache(data, mtime)
+                return data
+            except Exception as e:
+                logger.error(f"Error loading licenses: {e}")
+                # Keep the dict and the lookup sets in step: serve the last good copy if there is one,
+                # otherwise grant nothing
+                if self._cache is not None:
+                    return self._cache
+                self._licensed_set = frozenset()
+                self._admin_set = frozenset()
+                return {'licensed_emails': [], 'admin_emails': []}
     
     def _save_licenses(self, data: dict):
-        """Save license database"""
-        try:
-            with open(self.license_db_path, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving licenses: {e}")
-            raise
+        """Save license database (write to temp file + fsync + atomic rename)"""
+        with self._lock:
+            tmp_path = f"{self.license_db_path}.tmp.{os.getpid()}"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    # Pretty-print only in debug - compact JSON is smaller to write and parse
+                    if orjson is not None:
+                        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if settings.DEBUG else 0))
+                    else:
+                        f.write(json.dumps(data, indent=2 if settings.DEBUG else None).encode('utf-8'))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.license_db_path)
+                self._set_cache(data, os.stat(self.license_db_path).st_mtime_ns)
+            except Exception as e:
+                if os.path.exists(tmp_path):
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+                # Callers mutate the cached dict before saving - drop it so the next read hits disk
+                self._cache = None
+                logger.error(f"Error saving licenses: {e}")
+                raise
     
     def is_licensed(self, email: str) -> bool:
         """Check if email is licensed"""
-        licenses = self._load_licenses()
+        self._load_licenses()
         email_lower = email.lower().strip()
-        licensed_emails = [e.lower().strip() for e in licenses.get('licensed_emails', [])]
-        admin_emails = [e.lower().strip() for e in licenses.get('admin_emails', [])]
-        return email_lower in licensed_emails or email_lower in admin_emails
+        return email_lower in self._licensed_set or email_lower in self._admin_set
     
     def is_admin(self, email: str) -> bool:
         """Check if email is admin"""
-        licenses = self._load_licenses()
-        email_lower = email.lower().strip()
-        admin_emails = [e.lower().strip() for e in licenses.get('admin_emails', [])]
-        return email_lower in admin_emails
+        self._load_licenses()
+        return email.lower().strip() in self._admin_set
     
     def add_license(self, email: str, added_by: str) -> Tuple[bool, str]:
         """Add licensed email (admin only)"""
@@ -69,7 +118,7 @@ class LicenseService:
         licenses = self._load_licenses()
         email_lower = email.lower().strip()
         
-        if email_lower not in [e.lower().strip() for e in licenses.get('licensed_emails', [])]:
+        if email_lower not in self._licensed_set:
             licenses['licensed_emails'].append(email)
             licenses['last_updated'] = datetime.now().isoformat()
             licenses['last_updated_by'] = added_by
@@ -88,7 +137,7 @@ class LicenseService:
         email_lower = email.lower().strip()
         
         # Don't allow removing admin emails
-        if email_lower in [e.lower().strip() for e in licenses.get('admin_emails', [])]:
+        if email_lower in self._admin_set:
             return False, "Cannot remove admin email"
         
         licenses['licensed_emails'] = [
@@ -101,6 +150,53 @@ class LicenseService:
         logger.info(f"❌ Removed license for: {email}")
         return True, f"License removed for {email}"
     
+    def add_licenses(self, emails: Iterable[str], added_by: str) -> Tuple[bool, str]:
+        """Add many licensed emails with a single write (admin only)"""
+        if not self.is_admin(added_by):
+            return False, "Only admins can add licenses"
+    
+        licenses = self._load_licenses()
+        existing = set(self._licensed_set)
+        added = []
+        for email in emails:
+            email_lower = email.lower().strip()
+            if email_lower and email_lower not in existing:
+                licenses['licensed_emails'].append(email)
+                existing.add(email_lower)
+                added.append(email)
+    
+        if not added:
+            return False, "All emails already licensed"
+    
+        licenses['last_updated'] = datetime.now().isoformat()
+        licenses['last_updated_by'] = added_by
+        self._save_licenses(licenses)
+        logger.info(f"✅ Added {len(added)} licenses")
+        return True, f"Added {len(added)} licenses"
+    
+    def remove_licenses(self, emails: Iterable[str], removed_by: str) -> Tuple[bool, str]:
+        """Remove many licensed emails with a single write (admin only) - admin emails are skipped"""
+        if not self.is_admin(removed_by):
+            return False, "Only admins can remove licenses"
+    
+        licenses = self._load_licenses()
+        to_remove = {e.lower().strip() for e in emails} - self._admin_set
+        before = len(licenses.get('licensed_emails', []))
+        licenses['licensed_emails'] = [
+            e for e in licenses.get('licensed_emails', [])
+            if e.lower().strip() not in to_remove
+        ]
+        removed_count = before - len(licenses['licensed_emails'])
+    
+        if not removed_count:
+            return False, "No matching licenses to remove"
+    
+        licenses['last_updated'] = datetime.now().isoformat()
+        licenses['last_updated_by'] = removed_by
+        self._save_licenses(licenses)
+        logger.info(f"❌ Removed {removed_count} licenses")
+        return True, f"Removed {removed_count} licenses"
+    
     def list_licenses(self) -> List[str]:
         """List all licensed emails"""
         licenses = self._load_licenses()
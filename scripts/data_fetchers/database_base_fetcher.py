@@ -171,6 +171,11 @@ class DatabaseBaseFetcher:
             self.script_name, company, document_type, document_number, document_date
         )
 
+    def get_processed_document_numbers(self, company: str, document_type: str,
+                                       document_numbers: List[str]) -> set:
+        """Return the subset of document_numbers already processed, checked in one query"""
+        return self.db_manager.get_processed_document_numbers(company, document_type, document_numbers)
+
     def mark_document_processed(self, company: str, document_type: str,
                                document_number: str, document_date: str) -> bool:
         """Mark a document as processed (compatibility method - no-op for PostgreSQL)"""
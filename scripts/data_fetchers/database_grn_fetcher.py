@@ -116,7 +116,7 @@ class DatabaseGRNFetcher(DatabaseBaseFetcher):
         return formatted
 
     def process_single_grn(self, args) -> Optional[Dict]:
-        """Process a single GRN"""
+        """Process a single GRN (callers pass GRNs already filtered by get_processed_document_numbers)"""
         branch_info, session, token, grn = args
         
         try:
@@ -126,12 +126,6 @@ class DatabaseGRNFetcher(DatabaseBaseFetcher):
                 
             grn_date = self.safe_date_parse(grn.get("grnDate"))
             
-            # Check if already processed
-            if self.is_document_processed(
-                branch_info["company"], "GRN", doc_num, self.format_date_for_db(grn_date)
-            ):
-                return None
-            
             # Get GRN details
             details = self.get_grn_details(session, token, branch_info["branch_num"], doc_num)
             if not details:
@@ -176,19 +170,17 @@ class DatabaseGRNFetcher(DatabaseBaseFetcher):
                 self.logger.info(f"ℹ️ No GRNs found for {branch_name}")
                 return 0
             
-            # Filter out already processed GRNs
-            unprocessed_grns = []
-            for grn in all_grns:
-                doc_num = str(grn.get("grnNumber", "")).strip()
-                if not doc_num:
-                    continue
-                    
-                grn_date = self.safe_date_parse(grn.get("grnDate"))
-                
-                if not self.is_document_processed(
-                    company, "GRN", doc_num, self.format_date_for_db(grn_date)
-                ):
-                    unprocessed_grns.append(grn)
+            # Filter out already processed GRNs (one query for the whole branch, not one per GRN)
+            grns_with_numbers = [
+                (str(grn.get("grnNumber", "")).strip(), grn) for grn in all_grns
+            ]
+            processed_numbers = self.get_processed_document_numbers(
+                company, "GRN", [doc_num for doc_num, _ in grns_with_numbers if doc_num]
+            )
+            unprocessed_grns = [
+                grn for doc_num, grn in grns_with_numbers
+                if doc_num and doc_num not in processed_numbers
+            ]
             
             total_grns = len(all_grns)
             unprocessed_count = len(unprocessed_grns)
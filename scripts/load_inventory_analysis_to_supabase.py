@@ -191,14 +191,10 @@ def load_inventory_analysis(connection_string: str, csv_path: str):
                 
                 # Fallback to execute_values if COPY fails
                 logger.info(f"   Trying alternative method (execute_values)...")
+                # Prepare data as list of tuples - select/convert the columns once instead of per row
+                values_df = chunk_df[columns].astype(object)
+                data_tuples = list(values_df.where(values_df.notna(), None).itertuples(index=False, name=None))
                 try:
-                    # Prepare data as list of tuples
-                    data_tuples = []
-                    for _, row in chunk_df.iterrows():
-                        values = [row.get(col) for col in columns]
-                        values = [None if pd.isna(v) else v for v in values]
-                        data_tuples.append(tuple(values))
-                    
                     # Use execute_values for bulk insert into NEW table
                     column_names = ', '.join([f'"{col}"' for col in columns])
                     placeholders = ', '.join(['%s'] * len(columns))
@@ -217,10 +213,8 @@ def load_inventory_analysis(connection_string: str, csv_path: str):
                     # Try row by row as last resort
                     logger.info(f"   Trying row-by-row insert...")
                     inserted_in_chunk = 0
-                    for _, row in chunk_df.iterrows():
+                    for values in data_tuples:
                         try:
-                            values = [row.get(col) for col in columns]
-                            values = [None if pd.isna(v) else v for v in values]
                             cursor.execute(insert_sql, values)
                             conn.commit()
                             inserted_in_chunk += 1
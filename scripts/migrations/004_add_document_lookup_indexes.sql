@@ -0,0 +1,38 @@
+-- Migration: Add document lookup indexes
+-- This migration:
+-- 1. Indexes (company, document_number) on the four document tables
+-- 2. Serves is_document_processed(), get_processed_document_numbers() and
+--    get_existing_document_numbers(), which all filter on company + document_number
+--    (document_date is deliberately not compared, so it is not part of the key)
+--
+-- The existing UNIQUE (company, branch, document_number, item_code) constraints
+-- can't be used for this lookup past the company column, so without these every
+-- check scans all of a company's rows. The queries only read document_number,
+-- so the lookups are index-only scans.
+--
+-- CREATE INDEX CONCURRENTLY doesn't block inserts from a running refresh, but it
+-- can't run inside a transaction block - run this file as-is (no BEGIN/COMMIT).
+-- Safe to run multiple times (idempotent).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_grns_company_document_number
+    ON grns(company, document_number);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_purchase_orders_company_document_number
+    ON purchase_orders(company, document_number);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_branch_orders_company_document_number
+    ON branch_orders(company, document_number);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_supplier_invoices_company_document_number
+    ON supplier_invoices(company, document_number);
+
+-- ============================================================
+-- VERIFICATION QUERIES (run these to verify migration)
+-- ============================================================
+
+-- Verify indexes exist:
+-- SELECT tablename, indexname FROM pg_indexes
+-- WHERE indexname LIKE 'idx_%_company_document_number';
+
+-- Verify the lookup uses an index-only scan:
+-- EXPLAIN SELECT 1 FROM grns WHERE company = 'NILA' AND document_number = 'X' LIMIT 1;
@@ -39,7 +39,8 @@ def test_database_tables():
                 logger.error(f"❌ {table_name}: {result.get('error')}")
                 continue
             
-            logger.info(f"✅ {table_name}: {result['row_count']} rows")
+            approx = "~" if result.get('row_count_estimated') else ""
+            logger.info(f"✅ {table_name}: {approx}{result['row_count']} rows")
             logger.info(f"   Columns ({len(result['columns'])}):")
             
             for col in result['columns']: